@@ -0,0 +1,30 @@
+"""Form mapper active status index
+
+Revision ID: c92a5e1f3d47
+Revises: 537aa072d731
+Create Date: 2026-10-14 13:20:54.118036
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c92a5e1f3d47'
+down_revision = '537aa072d731'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_fpm_active_status',
+        'form_process_mapper',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_fpm_active_status', table_name='form_process_mapper')
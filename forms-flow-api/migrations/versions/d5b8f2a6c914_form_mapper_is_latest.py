@@ -0,0 +1,68 @@
+"""Form mapper is_latest flag
+
+Revision ID: d5b8f2a6c914
+Revises: c92a5e1f3d47
+Create Date: 2026-10-14 14:05:37.662190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5b8f2a6c914'
+down_revision = 'c92a5e1f3d47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'form_process_mapper',
+        sa.Column(
+            'is_latest',
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text('false'),
+            comment='Maintained by a trigger, true for the newest mapper of a parent form.',
+        ),
+    )
+    op.execute(
+        "UPDATE form_process_mapper SET is_latest = true WHERE id IN "
+        "(SELECT max(id) FROM form_process_mapper GROUP BY parent_form_id)"
+    )
+    # Unique so concurrent inserts for one parent form cannot both stay latest.
+    op.create_index(
+        'ix_fpm_latest',
+        'form_process_mapper',
+        ['parent_form_id'],
+        unique=True,
+        postgresql_where=sa.text('is_latest'),
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION form_process_mapper_set_latest()
+        RETURNS trigger AS $$
+        BEGIN
+            UPDATE form_process_mapper SET is_latest = false
+            WHERE parent_form_id = NEW.parent_form_id AND is_latest;
+            NEW.is_latest := true;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER form_process_mapper_set_latest "
+        "BEFORE INSERT ON form_process_mapper "
+        "FOR EACH ROW EXECUTE FUNCTION form_process_mapper_set_latest()"
+    )
+
+
+def downgrade():
+    op.execute(
+        "DROP TRIGGER IF EXISTS form_process_mapper_set_latest ON form_process_mapper"
+    )
+    op.execute("DROP FUNCTION IF EXISTS form_process_mapper_set_latest()")
+    op.drop_index('ix_fpm_latest', table_name='form_process_mapper')
+    op.drop_column('form_process_mapper', 'is_latest')
@@ -0,0 +1,30 @@
+"""Form mapper deleted server default
+
+Revision ID: e7a3c9d1b258
+Revises: d5b8f2a6c914
+Create Date: 2026-10-14 15:31:12.840527
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a3c9d1b258'
+down_revision = 'd5b8f2a6c914'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column('form_process_mapper', 'deleted',
+               existing_type=sa.Boolean(),
+               server_default=sa.text('false'),
+               existing_nullable=True)
+
+
+def downgrade():
+    op.alter_column('form_process_mapper', 'deleted',
+               existing_type=sa.Boolean(),
+               server_default=None,
+               existing_nullable=True)
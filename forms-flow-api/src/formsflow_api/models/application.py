@@ -144,7 +144,9 @@ class Application(
             table_name = "application"
             if order_by == "form_name":
                 table_name = "form_process_mapper"
-            query = query.order_by(text(f"{table_name}.{order_by} {sort_order}"))
+            query = query.order_by(
+                cls.order_by_clause(table_name, order_by, sort_order)
+            )
         total_count = query.count()
         pagination = query.paginate(page=page_no, per_page=limit, error_out=False)
         return pagination.items, total_count
@@ -212,7 +214,9 @@ class Application(
             table_name = "application"
             if order_by == "form_name":
                 table_name = "form_process_mapper"
-            query = query.order_by(text(f"{table_name}.{order_by} {sort_order}"))
+            query = query.order_by(
+                cls.order_by_clause(table_name, order_by, sort_order)
+            )
         total_count = query.count()
         pagination = query.paginate(page=page_no, per_page=limit, error_out=False)
         return pagination.items, total_count
@@ -290,7 +294,9 @@ class Application(
             table_name = "application"
             if order_by == "form_name":
                 table_name = "form_process_mapper"
-            query = query.order_by(text(f"{table_name}.{order_by} {sort_order}"))
+            query = query.order_by(
+                cls.order_by_clause(table_name, order_by, sort_order)
+            )
         total_count = query.count()
         pagination = query.paginate(page=page_no, per_page=limit, error_out=False)
         return pagination.items, total_count
@@ -311,24 +317,19 @@ class Application(
         Based on application auth permissions and user who submitted the application.
         """
         # Get latest row for each form_id group
-        filtered_form_query = FormProcessMapper.get_latest_form_mapper_ids()
-        filtered_form_ids = [
-            data.id for data in filtered_form_query if data.parent_form_id in form_ids
-        ]
+        latest_forms = FormProcessMapper.latest_form_mapper_filter(form_ids)
         query = cls.filter_conditions(**filters)
         query = FormProcessMapper.tenant_authorization(query=query)
-        query = query.filter(
-            or_(
-                FormProcessMapper.id.in_(filtered_form_ids), cls.created_by == user_name
-            )
-        )
+        query = query.filter(or_(latest_forms, cls.created_by == user_name))
         query = cls.filter_draft_applications(query=query)
         order_by, sort_order = validate_sort_order_and_order_by(order_by, sort_order)
         if order_by and sort_order:
             table_name = "application"
             if order_by == "form_name":
                 table_name = "form_process_mapper"
-            query = query.order_by(text(f"{table_name}.{order_by} {sort_order}"))
+            query = query.order_by(
+                cls.order_by_clause(table_name, order_by, sort_order)
+            )
         total_count = query.count()
         pagination = query.paginate(page=page_no, per_page=limit, error_out=False)
         return pagination.items, total_count
@@ -776,19 +777,12 @@ class Application(
     def get_auth_application_count_by_form_id_user(cls, form_ids, user_name):
         """Retrieves authorized application count by form ids & submitted user."""
         # Get latest row for each form_id group
-        filtered_form_query = FormProcessMapper.get_latest_form_mapper_ids()
-        filtered_form_ids = [
-            data.id for data in filtered_form_query if data.parent_form_id in form_ids
-        ]
+        latest_forms = FormProcessMapper.latest_form_mapper_filter(form_ids)
         query = FormProcessMapper.tenant_authorization(
             query=cls.query.join(
                 FormProcessMapper, cls.form_process_mapper_id == FormProcessMapper.id
             )
         )
-        query = query.filter(
-            or_(
-                FormProcessMapper.id.in_(filtered_form_ids), cls.created_by == user_name
-            )
-        )
+        query = query.filter(or_(latest_forms, cls.created_by == user_name))
         query = cls.filter_draft_applications(query=query)
         return query.count()
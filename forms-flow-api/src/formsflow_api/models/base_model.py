@@ -1,8 +1,10 @@
 """This manages Base Model functions."""
 
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, Optional
 
 from flask import current_app
+from sqlalchemy import TextClause, text
 
 from formsflow_api.models.db import db
 
@@ -40,7 +42,7 @@ class BaseModel:
                     setattr(self, key, values[key])
 
     @staticmethod
-    def create_filter_condition(  # pylint: disable=inconsistent-return-statements
+    def create_filter_condition(
         model: Any, column_name: str, operator: str, value: str
     ):
         """Function to create_filter_condition.
@@ -48,25 +50,42 @@ class BaseModel:
         To transform column_name, operator and values
         with a filtering conditions used by DB Model.
         """
+        build_condition = BaseModel.create_filter_builder(model, column_name, operator)
+        if build_condition is None:
+            return None
+        return build_condition(value)
+
+    @staticmethod
+    def create_filter_builder(
+        model: Any, column_name: str, operator: str
+    ) -> Optional[Callable[[str], Any]]:
+        """Function to create_filter_builder.
+
+        Resolves the column and comparison operator once and returns
+        a function which builds the filtering condition for a value.
+        """
         # get in format model.colum_name
         column = getattr(model, column_name)
-        if column:
-            try:
-                # get filter equivalent comparision operator
-                attr = (
-                    list(
-                        filter(
-                            lambda e: hasattr(column, e % operator),
-                            ["%s", "%s_", "__%s__"],
-                        )
-                    )[0]
-                    % operator
-                )
-            except IndexError as err:
-                current_app.logger.warning(
-                    f"Invalid filter operator: {operator}, {err}"
-                )
-                raise err
+        if not column:
+            return None
+        try:
+            # get filter equivalent comparision operator
+            attr = (
+                list(
+                    filter(
+                        lambda e: hasattr(column, e % operator),
+                        ["%s", "%s_", "__%s__"],
+                    )
+                )[0]
+                % operator
+            )
+        except IndexError as err:
+            current_app.logger.warning(f"Invalid filter operator: {operator}, {err}")
+            raise err
+        compare = getattr(column, attr)
+
+        def build_condition(value: str):
+            """Build the filtering condition for the given value."""
             if value == "null":
                 value = None
             if operator == "ilike":
@@ -74,8 +93,20 @@ class BaseModel:
                 # making the search space insensitive
                 value = value.replace(" ", "%")
             # Corresponding to model.column_name apply operator with specific value
-            filt = getattr(column, attr)(value)
-            return filt
+            return compare(value)
+
+        return build_condition
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def order_by_clause(
+        table_name: str, column_name: str, sort_order: str
+    ) -> TextClause:
+        """Return the ORDER BY clause for a validated column and sort order.
+
+        Used LRU cache so each combination reuses a single clause object.
+        """
+        return text(f"{table_name}.{column_name} {sort_order}")
 
     @staticmethod
     def execute(statement):
@@ -14,7 +14,6 @@ from formsflow_api_utils.utils.enums import DraftStatus
 from formsflow_api_utils.utils.user_context import UserContext, user_context
 from sqlalchemy import and_, update
 from sqlalchemy.dialects.postgresql import JSON, UUID
-from sqlalchemy.sql.expression import text
 
 from .application import Application
 from .audit_mixin import AuditDateTimeMixin
@@ -145,7 +144,9 @@ class Draft(AuditDateTimeMixin, BaseModel, db.Model):
         sort_by, sort_order = validate_sort_order_and_order_by(sort_by, sort_order)
         model_name = "form_process_mapper" if sort_by == "form_name" else "draft"
         if sort_by and sort_order:
-            result = result.order_by(text(f"{model_name}.{sort_by} {sort_order}"))
+            result = result.order_by(
+                cls.order_by_clause(model_name, sort_by, sort_order)
+            )
         result = FormProcessMapper.tenant_authorization(result)
         total_count = result.count()
         limit = total_count if limit is None else limit
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from collections import namedtuple
 from http import HTTPStatus
+from itertools import chain
+from typing import Dict, List, Tuple
 
 from flask import current_app
 from flask_sqlalchemy.query import Query
@@ -10,20 +13,51 @@ from formsflow_api_utils.utils import (
     DEFAULT_PROCESS_KEY,
     DEFAULT_PROCESS_NAME,
     FILTER_MAPS,
+    cache,
     validate_sort_order_and_order_by,
 )
 from formsflow_api_utils.utils.enums import FormProcessMapperStatus
 from formsflow_api_utils.utils.user_context import UserContext, user_context
-from sqlalchemy import UniqueConstraint, and_, desc, func
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import (
+    UniqueConstraint,
+    and_,
+    any_,
+    bindparam,
+    desc,
+    event,
+    func,
+    true,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSON
+from sqlalchemy.orm import Session, object_session
 from sqlalchemy.sql.expression import text
 
 from .audit_mixin import AuditDateTimeMixin, AuditUserMixin
 from .base_model import BaseModel
 from .db import db
 
+ACTIVE_COUNT_CACHE_KEY = "form_process_mapper_active_count"
+ACTIVE_COUNT_CACHE_TIMEOUT = 60
+BULK_INSERT_BATCH_SIZE = 1000
+STREAM_BATCH_SIZE = 1000
+DEFAULT_PAGE_SIZE = 20
+
+# Read only rows returned by the list endpoints, in projection order.
+FormListRow = namedtuple(
+    "FormListRow",
+    "id process_key form_id form_name modified status is_anonymous form_type "
+    "created description",
+)
+AuthorizedFormListRow = namedtuple(
+    "AuthorizedFormListRow", "id process_key form_id form_name modified description"
+)
+ActiveFormListRow = namedtuple("ActiveFormListRow", "id process_key form_id form_name")
+
 
-class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model):
+class FormProcessMapper(
+    AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model
+):  # pylint: disable=too-many-public-methods
     """This class manages form process mapper information."""
 
     id = db.Column(db.Integer, primary_key=True)
@@ -31,9 +65,11 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
     form_name = db.Column(db.String(100), nullable=False)
     form_type = db.Column(db.String(20), nullable=False)
     parent_form_id = db.Column(db.String(50), nullable=False)
-    process_key = db.Column(db.String(50), nullable=True, default=DEFAULT_PROCESS_KEY)
+    process_key = db.Column(
+        db.String(50), nullable=True, server_default=DEFAULT_PROCESS_KEY
+    )
     process_name = db.Column(
-        db.String(100), nullable=True, default=DEFAULT_PROCESS_NAME
+        db.String(100), nullable=True, server_default=DEFAULT_PROCESS_NAME
     )
     status = db.Column(db.String(10), nullable=True)
     comments = db.Column(db.String(300), nullable=True)
@@ -48,10 +84,16 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
         "Application", backref="form_process_mapper", lazy=True
     )
     is_anonymous = db.Column(db.Boolean, nullable=True)
-    deleted = db.Column(db.Boolean, nullable=True, default=False)
+    deleted = db.Column(db.Boolean, nullable=True, server_default=text("false"))
     task_variable = db.Column(JSON, nullable=True)
-    version = db.Column(db.Integer, nullable=False, default=1)
+    version = db.Column(db.Integer, nullable=False, server_default=text("1"))
     description = db.Column(db.String, nullable=True)
+    is_latest = db.Column(
+        db.Boolean,
+        nullable=False,
+        server_default=text("false"),
+        comment="Maintained by a trigger, true for the newest mapper of a parent form.",
+    )
 
     __table_args__ = (
         UniqueConstraint("form_id", "version", "tenant", name="_form_version_uc"),
@@ -88,6 +130,20 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
         }, HTTPStatus.BAD_REQUEST
         return response, status
 
+    @classmethod
+    def bulk_create_from_dicts(cls, mapper_infos: List[dict]) -> None:
+        """Create mappers between forms and processes in bulk.
+
+        Rows are inserted in batches outside the unit of work, so the
+        mapper events do not fire and the cached count is cleared here.
+        """
+        for start in range(0, len(mapper_infos), BULK_INSERT_BATCH_SIZE):
+            db.session.bulk_insert_mappings(
+                cls, mapper_infos[start : start + BULK_INSERT_BATCH_SIZE]
+            )
+        db.session.commit()
+        cache.delete(ACTIVE_COUNT_CACHE_KEY)
+
     def update(self, mapper_info: dict):
         """Update form process mapper."""
         self.update_from_dict(
@@ -121,6 +177,42 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
         self.status: str = str(FormProcessMapperStatus.INACTIVE.value)
         self.commit()
 
+    @classmethod
+    def bulk_mark_inactive(cls, ids: List[int]) -> int:
+        """Mark the given form process mappers as inactive and deleted."""
+        return cls._bulk_update_status(
+            ids,
+            {
+                cls.status: str(FormProcessMapperStatus.INACTIVE.value),
+                cls.deleted: True,
+            },
+        )
+
+    @classmethod
+    def bulk_mark_unpublished(cls, ids: List[int]) -> int:
+        """Mark the given active form process mappers as inactive."""
+        return cls._bulk_update_status(
+            ids,
+            {cls.status: str(FormProcessMapperStatus.INACTIVE.value)},
+            cls.status == str(FormProcessMapperStatus.ACTIVE.value),
+        )
+
+    @classmethod
+    def _bulk_update_status(cls, ids: List[int], values: dict, *criteria) -> int:
+        """Apply values to the given mappers in a single UPDATE statement.
+
+        Returns the number of updated rows.
+        """
+        if not ids:
+            return 0
+        updated = cls.query.filter(cls.id.in_(ids), *criteria).update(
+            values, synchronize_session=False
+        )
+        db.session.commit()
+        # Query.update skips the mapper events, so invalidate here.
+        cache.delete(ACTIVE_COUNT_CACHE_KEY)
+        return updated
+
     @classmethod
     def find_all(cls, page_number, limit):
         """Fetch all the form process mappers."""
@@ -137,17 +229,11 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
     @classmethod
     def filter_conditions(cls, **filters):
         """This method creates dynamic filter conditions based on the input param."""
-        filter_conditions = []
-        for key, value in filters.items():
-            if value:
-                filter_map = FILTER_MAPS[key]
-                condition = FormProcessMapper.create_filter_condition(
-                    model=FormProcessMapper,
-                    column_name=filter_map["field"],
-                    operator=filter_map["operator"],
-                    value=value,
-                )
-                filter_conditions.append(condition)
+        filter_conditions = [
+            FILTER_CONDITION_BUILDERS[key](value)
+            for key, value in filters.items()
+            if value
+        ]
         query = cls.query.filter(*filter_conditions) if filter_conditions else cls.query
         return query
 
@@ -155,8 +241,6 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
     @user_context
     def access_filter(cls, query: Query, **kwargs):
         """Modifies the query to include active and tenant check."""
-        if not isinstance(query, Query):
-            raise TypeError("Query object must be of type Query")
         user: UserContext = kwargs["user"]
         tenant_key: str = user.tenant_key
         active = query.filter(
@@ -166,20 +250,65 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
             active = active.filter(FormProcessMapper.tenant == tenant_key)
         return active
 
-    @classmethod
-    def get_latest_form_mapper_ids(cls):
-        """Getting latest mapper id of a form, based on parentFormId."""
-        # Execute a query to retrieve the maximum ID of the form mapper and the parent form ID
-        # Since each form has one or more versions so we need latest from based on parentId
-        return (
-            db.session.query(
-                func.max(cls.id).label("id"),  # pylint: disable=not-callable
-                cls.parent_form_id,
+    @staticmethod
+    def sort_query(query: Query, sort_by: str, sort_order: str) -> Query:
+        """Order the query by a form process mapper column if the params are valid."""
+        sort_by, sort_order = validate_sort_order_and_order_by(sort_by, sort_order)
+        column = SORTABLE_COLUMNS.get(sort_by)
+        if column is not None and sort_order:
+            query = query.order_by(
+                column.desc() if sort_order == "desc" else column.asc()
             )
-            # Group the results by the parent form ID
-            .group_by(cls.parent_form_id)
-            # Retrieve all the results as a list of tuples
-            .all()
+        return query
+
+    @staticmethod
+    def fetch_page(query: Query, row_type: type, page_number: int, limit: int):
+        """Fetch a page of rows along with the total row count.
+
+        The total is computed with a count window function in the same statement.
+        Rows are built as row_type tuples straight from the cursor, and are
+        streamed from a server side cursor when no limit is given.
+        """
+        query = query.add_columns(
+            func.count().over().label("total_count")  # pylint: disable=not-callable
+        )
+        if limit is None:
+            rows = iter(
+                db.session.execute(
+                    query.statement, execution_options={"yield_per": STREAM_BATCH_SIZE}
+                )
+            )
+            first = next(rows, None)
+            if first is None:
+                return [], 0
+            items = (row_type(*row[:-1]) for row in chain([first], rows))
+            return items, first[-1]
+        # Same fallback as paginate() for a page size below one.
+        limit = limit if limit >= 1 else DEFAULT_PAGE_SIZE
+        offset = (max(page_number or 1, 1) - 1) * limit
+        statement = query.limit(limit).offset(offset).statement
+        rows = db.session.execute(statement).all()
+        if rows:
+            return [row_type(*row[:-1]) for row in rows], rows[0][-1]
+        # A page past the end has no row to carry the total, so count separately.
+        total_count = query.count() if offset else 0
+        return [], total_count
+
+    @classmethod
+    def latest_form_mapper_filter(cls, form_ids):
+        """Getting latest mapper condition of the given forms, based on parentFormId."""
+        # Since each form has one or more versions so we need latest from based on parentId.
+        # is_latest is kept up to date by a trigger on insert and compared with
+        # "= true" so the planner can match the ix_fpm_latest partial index.
+        # form_ids is bound as a single array parameter instead of an IN list.
+        parent_form_ids = bindparam(
+            "parent_form_ids",
+            value=list(form_ids),
+            type_=ARRAY(db.String),
+            unique=True,
+        )
+        return and_(
+            cls.is_latest == true(), cls.parent_form_id == any_(parent_form_ids)
         )
 
     @classmethod
@@ -196,14 +325,10 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
     ):  # pylint: disable=too-many-arguments
         """Fetch all active and inactive forms which are not deleted."""
         # Get latest row for each form_id group
-        filtered_form_query = cls.get_latest_form_mapper_ids()
-        filtered_form_ids = [
-            data.id for data in filtered_form_query if data.parent_form_id in form_ids
-        ]
         query = cls.filter_conditions(**filters)
         query = query.filter(
             and_(FormProcessMapper.deleted.is_(False)),
-            FormProcessMapper.id.in_(filtered_form_ids),
+            cls.latest_form_mapper_filter(form_ids),
         )
         # form type is list of type to filter the form
         if form_type:
@@ -214,11 +339,8 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
             query = query.filter(FormProcessMapper.status == value)
 
         query = cls.tenant_authorization(query=query)
-        sort_by, sort_order = validate_sort_order_and_order_by(sort_by, sort_order)
-        if sort_by and sort_order:
-            query = query.order_by(text(f"form_process_mapper.{sort_by} {sort_order}"))
+        query = cls.sort_query(query, sort_by, sort_order)
 
-        total_count = query.count()
         query = query.with_entities(
             cls.id,
             cls.process_key,
@@ -231,9 +353,7 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
             cls.created,
             cls.description,
         )
-        limit = total_count if limit is None else limit
-        query = query.paginate(page=page_number, per_page=limit, error_out=False)
-        return query.items, total_count
+        return cls.fetch_page(query, FormListRow, page_number, limit)
 
     @classmethod
     def find_all_active_by_formid(
@@ -247,20 +367,13 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
     ):  # pylint: disable=too-many-arguments
         """Fetch all active form process mappers by authorized forms."""
         # Get latest row for each form_id group
-        filtered_form_query = cls.get_latest_form_mapper_ids()
-        filtered_form_ids = [
-            data.id for data in filtered_form_query if data.parent_form_id in form_ids
-        ]
         query = cls.filter_conditions(**filters)
         query = query.filter(
-            FormProcessMapper.id.in_(filtered_form_ids),
+            cls.latest_form_mapper_filter(form_ids),
         )
         query = cls.access_filter(query=query)
-        sort_by, sort_order = validate_sort_order_and_order_by(sort_by, sort_order)
-        if sort_by and sort_order:
-            query = query.order_by(text(f"form_process_mapper.{sort_by} {sort_order}"))
+        query = cls.sort_query(query, sort_by, sort_order)
 
-        total_count = query.count()
         query = query.with_entities(
             cls.id,
             cls.process_key,
@@ -269,9 +382,7 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
             cls.modified,
             cls.description,
         )
-        limit = total_count if limit is None else limit
-        query = query.paginate(page=page_number, per_page=limit, error_out=False)
-        return query.items, total_count
+        return cls.fetch_page(query, AuthorizedFormListRow, page_number, limit)
 
     @classmethod
     def find_all_active(
@@ -288,27 +399,31 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
         if process_key is not None:
             query = query.filter(FormProcessMapper.process_key.in_(process_key))
         query = cls.access_filter(query=query)
-        sort_by, sort_order = validate_sort_order_and_order_by(sort_by, sort_order)
-        if sort_by and sort_order:
-            query = query.order_by(text(f"form_process_mapper.{sort_by} {sort_order}"))
+        query = cls.sort_query(query, sort_by, sort_order)
 
-        total_count = query.count()
         query = query.with_entities(
             cls.id,
             cls.process_key,
             cls.form_id,
             cls.form_name,
         )
-        limit = total_count if limit is None else limit
-        query = query.paginate(page=page_number, per_page=limit, error_out=False)
-        return query.items, total_count
+        return cls.fetch_page(query, ActiveFormListRow, page_number, limit)
 
     @classmethod
     def find_all_count(cls):
-        """Fetch the total active form process mapper which are active."""
-        return cls.query.filter(
-            FormProcessMapper.status == str(FormProcessMapperStatus.ACTIVE.value)
-        ).count()
+        """Fetch the total active form process mapper which are active.
+
+        The count is cached and invalidated once a transaction writing a mapper
+        commits. The cache is per process, so other workers may serve a stale
+        count until the cache timeout expires.
+        """
+        count = cache.get(ACTIVE_COUNT_CACHE_KEY)
+        if count is None:
+            count = cls.query.filter(
+                FormProcessMapper.status == str(FormProcessMapperStatus.ACTIVE.value)
+            ).count()
+            cache.set(ACTIVE_COUNT_CACHE_KEY, count, timeout=ACTIVE_COUNT_CACHE_TIMEOUT)
+        return count
 
     @classmethod
     def find_form_by_id_active_status(cls, form_process_mapper_id) -> FormProcessMapper:
@@ -337,6 +452,21 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
             .first()
         )  # pylint: disable=no-member
 
+    @classmethod
+    def find_latest_by_form_ids(
+        cls, form_ids: List[str]
+    ) -> Dict[str, FormProcessMapper]:
+        """Find the latest version mapper of each provided form_id in one query."""
+        if not form_ids:
+            return {}
+        mappers = (
+            cls.query.filter(FormProcessMapper.form_id.in_(form_ids))
+            .order_by(FormProcessMapper.form_id, desc(FormProcessMapper.version))
+            .distinct(FormProcessMapper.form_id)
+            .all()
+        )
+        return {mapper.form_id: mapper for mapper in mappers}
+
     @classmethod
     @user_context
     def find_mapper_by_form_id_and_version(
@@ -357,6 +487,25 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
         ).first()
         return query
 
+    @classmethod
+    @user_context
+    def find_mappers_by_form_id_version_pairs(
+        cls, pairs: List[Tuple[str, int]], **kwargs
+    ) -> Dict[Tuple[str, int], FormProcessMapper]:
+        """
+        Return the form process mappers matching the given (form_id, version) pairs.
+
+        : pairs : list of (form_id, version) tuples, fetched in a single query
+        """
+        if not pairs:
+            return {}
+        user: UserContext = kwargs["user"]
+        tenant_key: str = user.tenant_key
+        mappers = cls.query.filter(
+            and_(tuple_(cls.form_id, cls.version).in_(pairs), cls.tenant == tenant_key)
+        ).all()
+        return {(mapper.form_id, mapper.version): mapper for mapper in mappers}
+
     @classmethod
     @user_context
     def tenant_authorization(cls, query: Query, **kwargs):
@@ -364,8 +513,46 @@ class FormProcessMapper(AuditDateTimeMixin, AuditUserMixin, BaseModel, db.Model)
         tenant_auth_query: Query = query
         user: UserContext = kwargs["user"]
         tenant_key: str = user.tenant_key
-        if not isinstance(query, Query):
-            raise TypeError("Query object must be of type Query")
         if tenant_key is not None:
             tenant_auth_query = tenant_auth_query.filter(cls.tenant == tenant_key)
         return tenant_auth_query
+
+
+# Columns the list endpoints are allowed to order by, resolved once at import.
+SORTABLE_COLUMNS = {
+    column.name: column for column in FormProcessMapper.__table__.columns
+}
+
+# Filter condition builders for the mapper columns, resolved once at import.
+FILTER_CONDITION_BUILDERS = {
+    key: FormProcessMapper.create_filter_builder(
+        model=FormProcessMapper,
+        column_name=filter_map["field"],
+        operator=filter_map["operator"],
+    )
+    for key, filter_map in FILTER_MAPS.items()
+    if hasattr(FormProcessMapper, filter_map["field"])
+}
+
+
+@event.listens_for(FormProcessMapper, "after_insert")
+@event.listens_for(FormProcessMapper, "after_update")
+@event.listens_for(FormProcessMapper, "after_delete")
+def mark_active_count_stale(
+    mapper, connection, target
+):  # pylint: disable=unused-argument
+    """Flag the session so the cached active count is cleared on commit."""
+    object_session(target).info[ACTIVE_COUNT_CACHE_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def clear_active_count_cache(session):
+    """Invalidate the cached active mapper count once mapper writes commit."""
+    if session.info.pop(ACTIVE_COUNT_CACHE_KEY, False):
+        cache.delete(ACTIVE_COUNT_CACHE_KEY)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_active_count_stale(session):
+    """Drop the invalidation flag of rolled back mapper writes."""
+    session.info.pop(ACTIVE_COUNT_CACHE_KEY, None)
@@ -168,7 +168,7 @@ class ApplicationService:  # pylint: disable=too-many-public-methods
         # access, resource_list = ApplicationService._application_access(token)
         user: UserContext = kwargs["user"]
         user_name: str = user.user_name
-        form_ids: Set[str] = []
+        form_ids: Set[str] = set()
         forms = Authorization.find_all_resources_authorized(
             auth_type=AuthType.APPLICATION,
             roles=user.group_or_roles,
@@ -176,7 +176,7 @@ class ApplicationService:  # pylint: disable=too-many-public-methods
             tenant=user.tenant_key,
         )
         for form in forms:
-            form_ids.append(form.resource_id)
+            form_ids.add(form.resource_id)
         (
             applications,
             get_all_applications_count,
@@ -461,7 +461,7 @@ class ApplicationService:  # pylint: disable=too-many-public-methods
         """Retrieves the active application count."""
         user: UserContext = kwargs["user"]
         user_name = user.user_name
-        form_ids: Set[str] = []
+        form_ids: Set[str] = set()
         application_count = None
         if auth.has_role([REVIEWER_GROUP]):
             forms = Authorization.find_all_resources_authorized(
@@ -471,7 +471,7 @@ class ApplicationService:  # pylint: disable=too-many-public-methods
                 tenant=user.tenant_key,
             )
             for form in forms:
-                form_ids.append(form.resource_id)
+                form_ids.add(form.resource_id)
             application_count = Application.get_auth_application_count_by_form_id_user(
                 form_ids, user_name
             )
@@ -36,7 +36,7 @@ class FormProcessMapperService:
     ):  # pylint: disable=too-many-arguments, too-many-locals
         """Get all forms."""
         user: UserContext = kwargs["user"]
-        authorized_form_ids: Set[str] = []
+        authorized_form_ids: Set[str] = set()
         form_ids = Authorization.find_all_resources_authorized(
             auth_type=AuthType.DESIGNER if is_designer else AuthType.FORM,
             roles=user.group_or_roles,
@@ -45,7 +45,7 @@ class FormProcessMapperService:
             include_created_by=is_designer,
         )
         for forms in form_ids:
-            authorized_form_ids.append(forms.resource_id)
+            authorized_form_ids.add(forms.resource_id)
         designer_filters = {
             "is_active": is_active,
             "form_type": form_type,
@@ -208,11 +208,7 @@ class FormProcessMapperService:
     @staticmethod
     def mark_unpublished(form_process_mapper_id):
         """Mark form process mapper as inactive."""
-        mapper = FormProcessMapper.find_form_by_id_active_status(
-            form_process_mapper_id=form_process_mapper_id
-        )
-        if mapper:
-            mapper.mark_unpublished()
+        if FormProcessMapper.bulk_mark_unpublished([form_process_mapper_id]):
             return
         raise BusinessException(BusinessErrorCode.INVALID_FORM_PROCESS_MAPPER_ID)
 
@@ -5,12 +5,14 @@ import os
 import pytest
 from alembic import command
 from alembic.config import Config
+from formsflow_api_utils.utils import cache
 from formsflow_api_utils.utils import jwt as _jwt
 from formsflow_api_utils.utils.startup import setup_jwt_manager
 from sqlalchemy import text
 
 from formsflow_api import create_app
 from formsflow_api.models import db as _db
+from formsflow_api.models.form_process_mapper import ACTIVE_COUNT_CACHE_KEY
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -88,6 +90,8 @@ def session(app, database):  # pylint: disable=redefined-outer-name, invalid-nam
         sess = _db.session()
         for tr in sess.execute(truncate_all_expr).fetchall():
             sess.execute(text(tr[0]))
+        # The cached active count would outlive the truncated tables.
+        cache.delete(ACTIVE_COUNT_CACHE_KEY)
 
         conn = database.engine.connect()
         sess = database.session
@@ -1,5 +1,12 @@
 """Unit tests for FormProcessMapper Model."""
+from flask import g
+
 from formsflow_api.models import FormProcessMapper
+from formsflow_api.models.form_process_mapper import ActiveFormListRow
+from tests.utilities.base_test import (
+    factory_form_process_mapper,
+    get_form_mapper_payload,
+)
 
 
 def test_formprocessmapper_creation(app, client, session):
@@ -39,3 +46,150 @@ def test_formprocessmapper_anonymous_creation(app, client, session):
     assert form.id == 5
     assert form.form_id == 12324
     assert form.is_anonymous is True
+
+
+def test_formprocessmapper_active_count_cache(app, client, session):
+    """Test the cached active count is invalidated when a mapper is created."""
+    assert FormProcessMapper.find_all_count() == 0
+    factory_form_process_mapper()
+    assert FormProcessMapper.find_all_count() == 1
+
+
+def test_formprocessmapper_find_latest_by_form_ids(app, client, session):
+    """Test the latest version of each form is fetched in bulk."""
+    for form_id, version in (("1234", 1), ("1234", 2), ("5678", 1)):
+        factory_form_process_mapper(form_id, version=version)
+    mappers = FormProcessMapper.find_latest_by_form_ids(["1234", "5678", "0000"])
+    assert set(mappers) == {"1234", "5678"}
+    assert mappers["1234"].version == 2
+    assert FormProcessMapper.find_latest_by_form_ids([]) == {}
+
+
+def test_formprocessmapper_bulk_create_from_dicts(app, client, session):
+    """Test FormProcessMapper rows can be created in bulk."""
+    assert FormProcessMapper.find_all_count() == 0
+    FormProcessMapper.bulk_create_from_dicts(
+        [get_form_mapper_payload(form_id) for form_id in ("1234", "5678")]
+    )
+    assert FormProcessMapper.find_all_count() == 2
+    assert FormProcessMapper.find_form_by_form_id("5678").version == 1
+
+
+def test_formprocessmapper_bulk_mark_inactive(app, client, session):
+    """Test FormProcessMapper rows can be marked inactive in bulk."""
+    ids = [
+        factory_form_process_mapper(form_id).id for form_id in ("1234", "5678", "9012")
+    ]
+    assert FormProcessMapper.find_all_count() == 3
+    assert FormProcessMapper.bulk_mark_unpublished(ids[:1]) == 1
+    assert FormProcessMapper.bulk_mark_unpublished(ids[:1]) == 0
+    assert FormProcessMapper.bulk_mark_inactive(ids[1:2]) == 1
+    assert FormProcessMapper.find_all_count() == 1
+    assert FormProcessMapper.find_form_by_id(ids[0]).deleted is False
+    assert FormProcessMapper.find_form_by_id(ids[1]).deleted is True
+
+
+def test_formprocessmapper_is_latest(app, client, session):
+    """Test only the newest mapper of a parent form is flagged as latest."""
+    for form_id, version in (("1234", 1), ("5678", 2)):
+        factory_form_process_mapper(form_id, parent_form_id="1234", version=version)
+    latest = FormProcessMapper.query.filter(
+        FormProcessMapper.latest_form_mapper_filter(["1234"])
+    ).all()
+    assert [mapper.form_id for mapper in latest] == ["5678"]
+
+
+def test_formprocessmapper_bulk_create_is_latest(app, client, session):
+    """Test only the last mapper of a parent form in one bulk insert is latest."""
+    FormProcessMapper.bulk_create_from_dicts(
+        [
+            get_form_mapper_payload(form_id, parent_form_id="1234", version=version)
+            for form_id, version in (("1234", 1), ("5678", 2))
+        ]
+    )
+    latest = FormProcessMapper.query.filter(
+        FormProcessMapper.latest_form_mapper_filter(["1234"])
+    ).all()
+    assert [mapper.form_id for mapper in latest] == ["5678"]
+
+
+def test_formprocessmapper_sort_query(app, client, session):
+    """Test form process mapper queries are sorted by the resolved column."""
+    for form_id, form_name in (("1234", "b"), ("5678", "a"), ("9012", "c")):
+        factory_form_process_mapper(form_id, form_name=form_name)
+    query = FormProcessMapper.query
+    for sort_order, expected in (("asc", "abc"), ("desc", "cba")):
+        rows = FormProcessMapper.sort_query(query, "formName", sort_order).all()
+        assert "".join(row.form_name for row in rows) == expected
+    # An unknown sort key is not a mapper column and leaves the order untouched.
+    query = query.order_by(FormProcessMapper.id)
+    rows = FormProcessMapper.sort_query(query, "applicationStatus", "desc").all()
+    assert "".join(row.form_name for row in rows) == "bac"
+
+
+def test_formprocessmapper_find_mappers_by_form_id_version_pairs(app, client, session):
+    """Test the mappers of the given form id and version pairs are fetched in bulk."""
+    g.jwt_oidc_token_info = {"tenantKey": "tenant1"}
+    factory_form_process_mapper("1234", tenant="tenant1")
+    factory_form_process_mapper("5678", tenant="tenant1")
+    factory_form_process_mapper("9012", tenant="tenant2")
+    mappers = FormProcessMapper.find_mappers_by_form_id_version_pairs(
+        [("1234", 1), ("5678", 2), ("9012", 1)]
+    )
+    assert list(mappers) == [("1234", 1)]
+    assert mappers[("1234", 1)].tenant == "tenant1"
+    assert FormProcessMapper.find_mappers_by_form_id_version_pairs([]) == {}
+
+
+def _create_form_list_mappers(count):
+    """Create active form process mappers for the list tests."""
+    for index in range(count):
+        factory_form_process_mapper(str(index), form_name=f"Sample form {index}")
+    return FormProcessMapper.query.order_by(FormProcessMapper.id).with_entities(
+        FormProcessMapper.id,
+        FormProcessMapper.process_key,
+        FormProcessMapper.form_id,
+        FormProcessMapper.form_name,
+    )
+
+
+def test_formprocessmapper_fetch_page(app, client, session):
+    """Test a page of rows is fetched along with the total count."""
+    query = _create_form_list_mappers(3)
+    items, total_count = FormProcessMapper.fetch_page(query, ActiveFormListRow, 2, 2)
+    assert [item.form_id for item in items] == ["2"]
+    assert total_count == 3
+
+
+def test_formprocessmapper_fetch_page_past_end(app, client, session):
+    """Test the total count is still returned for a page past the end."""
+    query = _create_form_list_mappers(3)
+    items, total_count = FormProcessMapper.fetch_page(query, ActiveFormListRow, 5, 2)
+    assert items == []
+    assert total_count == 3
+
+
+def test_formprocessmapper_fetch_page_without_limit(app, client, session):
+    """Test all rows are streamed when no limit is given."""
+    items, total_count = FormProcessMapper.fetch_page(
+        _create_form_list_mappers(0), ActiveFormListRow, None, None
+    )
+    assert list(items) == []
+    assert total_count == 0
+    query = _create_form_list_mappers(3)
+    items, total_count = FormProcessMapper.fetch_page(
+        query, ActiveFormListRow, None, None
+    )
+    assert [item.form_id for item in items] == ["0", "1", "2"]
+    assert total_count == 3
+
+
+def test_formprocessmapper_fetch_page_invalid_limit(app, client, session):
+    """Test a limit below one falls back to the default page size."""
+    query = _create_form_list_mappers(3)
+    for limit in (0, -1):
+        items, total_count = FormProcessMapper.fetch_page(
+            query, ActiveFormListRow, 1, limit
+        )
+        assert len(items) == 3
+        assert total_count == 3
@@ -6,7 +6,7 @@ from dotenv import find_dotenv, load_dotenv
 from flask import current_app
 from jose import jwt as json_web_token
 
-from formsflow_api.models import Authorization, AuthType
+from formsflow_api.models import Authorization, AuthType, FormProcessMapper
 
 load_dotenv(find_dotenv())
 
@@ -551,6 +551,24 @@ def factory_auth(
     ).save()
 
 
+def get_form_mapper_payload(form_id: str = "1234", **kwargs) -> dict:
+    """Return form process mapper model data, overridden by the kwargs."""
+    return {
+        "form_id": form_id,
+        "form_name": "Sample form",
+        "status": "active",
+        "created_by": "test",
+        "form_type": "form",
+        "parent_form_id": form_id,
+        **kwargs,
+    }
+
+
+def factory_form_process_mapper(form_id: str = "1234", **kwargs) -> FormProcessMapper:
+    """Return a saved form process mapper model instance."""
+    return FormProcessMapper(**get_form_mapper_payload(form_id, **kwargs)).save()
+
+
 def get_filter_payload(name: str = "Test Task", roles: list = [], users: list = []):
     """Return filter create payload."""
     return {